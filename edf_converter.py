@@ -7,10 +7,231 @@ to various formats including CSV, JSON, and NumPy arrays.
 import mne
 import numpy as np
 import json
-import csv
+import os
+from datetime import datetime, timezone
+from multiprocessing import Pool
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for streamed text exports; the default 8 KiB costs a syscall per
+# few rows on large recordings
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _json_default(obj):
+    """Convert numpy values for the standard library JSON encoder."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Encode an object containing numpy values as compact UTF-8 JSON.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=_json_default)
+    return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _write_json(output_path: str, obj: Dict, pretty: bool = False) -> None:
+    """
+    Write an object containing numpy arrays to a JSON file.
+
+    With orjson, arrays are encoded straight from their buffers; the stdlib
+    fallback converts them to lists through _json_default.
+
+    Args:
+        output_path (str): Path for the output JSON file
+        obj (Dict): Object to serialize
+        pretty (bool): Whether to indent the output
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        # Non-contiguous or unusual-dtype arrays fall through to _json_default
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option, default=_json_default))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(obj, f, indent=2 if pretty else None, default=_json_default)
+
+
+def _pretty_json_member(args: Tuple[str, object, int]) -> str:
+    """
+    Encode one object member as indented JSON text, for splicing into a document.
+
+    Module-level so it can be used as a multiprocessing worker.
+
+    Args:
+        args (Tuple[str, object, int]): (key, value, depth), where depth is the
+            nesting level of the member (1 = top-level key)
+
+    Returns:
+        str: '"key": value' lines indented by 2 * depth spaces, without a trailing comma
+    """
+    key, value, depth = args
+    lines = json.dumps({key: value}, indent=2, default=_json_default).split('\n')[1:-1]
+    pad = '  ' * (depth - 1)
+    return '\n'.join(pad + line for line in lines)
+
+
+# Physical dimension scaling to volts, copied from MNE's EDF reader (which also
+# treats every other unit, including 'V' and 'nV', as 1); '\x83\xcaV' is 'μV'
+# in Shift-JIS read as latin-1
+_EDF_UNIT_SCALE = {'\u03bcV': 1e-6, '\u00b5V': 1e-6, '\x83\xcaV': 1e-6, 'uV': 1e-6, 'mV': 1e-3}
+
+_edf_decoder = None
+
+
+def _get_edf_decoder():
+    """
+    Compile (once) and return the Numba kernel that decodes EDF data records.
+
+    Returns:
+        Callable: decoder(records, dig_min, gain, phys_min) -> np.ndarray
+
+    Raises:
+        ImportError: If numba is not installed
+    """
+    global _edf_decoder
+    if _edf_decoder is not None:
+        return _edf_decoder
+
+    try:
+        import numba
+    except ImportError:
+        raise ImportError("Fast EDF reading requires numba: pip install numba")
+
+    @numba.njit(parallel=True, fastmath=True)
+    def decode(records, dig_min, gain, phys_min):
+        # records: (n_records, n_channels * samples_per_record) int16, with each
+        # record holding the channels one after another
+        n_records = records.shape[0]
+        n_channels = dig_min.shape[0]
+        spr = records.shape[1] // n_channels
+        out = np.empty((n_channels, n_records * spr))
+        for ch in numba.prange(n_channels):
+            base = ch * spr
+            for r in range(n_records):
+                for k in range(spr):
+                    out[ch, r * spr + k] = (records[r, base + k] - dig_min[ch]) * gain[ch] + phys_min[ch]
+        return out
+
+    _edf_decoder = decode
+    return _edf_decoder
+
+
+def _read_edf_fast(filepath: Path):
+    """
+    Read a plain EDF file with the Numba decoder.
+
+    Only handles the common layout: continuous EDF/EDF+C with 16-bit samples,
+    no annotation signal and the same number of samples per record for every
+    channel. Anything else, including headers with non-numeric fields, returns
+    None so the caller can fall back to MNE.
+
+    Args:
+        filepath (Path): Path to the EDF file
+
+    Returns:
+        Optional[mne.io.RawArray]: Preloaded Raw object, or None if unsupported
+    """
+    with open(filepath, 'rb') as f:
+        header = f.read(256)
+        if len(header) < 256 or header[:8].strip() != b'0':
+            return None
+
+        def field(start, end):
+            return header[start:end].decode('latin-1').strip()
+
+        # Malformed numeric fields are left for MNE to handle (or report)
+        try:
+            reserved = field(192, 236)
+            n_records = int(field(236, 244))
+            record_duration = float(field(244, 252))
+            n_signals = int(field(252, 256))
+            if reserved.startswith('EDF+D') or n_records <= 0 or record_duration <= 0 or n_signals <= 0:
+                return None
+
+            signal_header = f.read(256 * n_signals)
+            if len(signal_header) < 256 * n_signals:
+                return None
+
+            def signal_fields(offset, width):
+                start = offset * n_signals
+                return [signal_header[start + i * width:start + (i + 1) * width].decode('latin-1').strip()
+                        for i in range(n_signals)]
+
+            labels = signal_fields(0, 16)
+            units = signal_fields(96, 8)
+            phys_min = np.array(signal_fields(104, 8), dtype=np.float64)
+            phys_max = np.array(signal_fields(112, 8), dtype=np.float64)
+            dig_min = np.array(signal_fields(120, 8), dtype=np.float64)
+            dig_max = np.array(signal_fields(128, 8), dtype=np.float64)
+            samples_per_record = [int(n) for n in signal_fields(216, 8)]
+        except ValueError:
+            return None
+
+        if ('EDF Annotations' in labels or len(set(labels)) != n_signals
+                or len(set(samples_per_record)) != 1 or np.any(dig_max == dig_min)):
+            return None
+
+        spr = samples_per_record[0]
+        record_size = n_signals * spr
+        raw_bytes = np.fromfile(f, dtype='<i2', count=n_records * record_size)
+        if raw_bytes.size < n_records * record_size:
+            return None
+
+    unit_scale = np.array([_EDF_UNIT_SCALE.get(u, 1.0) for u in units])
+    gain = (phys_max - phys_min) / (dig_max - dig_min) * unit_scale
+    records = raw_bytes.astype(np.int16, copy=False).reshape(n_records, record_size)
+    data = _get_edf_decoder()(records, dig_min, gain, phys_min * unit_scale)
+
+    info = mne.create_info(labels, spr / record_duration, ch_types='eeg')
+    raw = mne.io.RawArray(data, info, verbose=False)
+
+    # Same measurement date rules as MNE: prefer the EDF+ recording field's
+    # 4-digit-year date, then the header start date; an unparseable start time
+    # keeps the date at midnight
+    meas_date = None
+    rec_info = header[88:168].decode('latin-1').rstrip().split(' ')
+    if len(rec_info) == 5:
+        try:
+            meas_date = datetime.strptime(rec_info[1], '%d-%b-%Y')
+        except ValueError:
+            meas_date = None
+    if meas_date is None:
+        try:
+            day, month, year = (int(x) for x in header[168:176].decode('latin-1').split('.'))
+            year += 1900 if year >= 85 else 2000
+            meas_date = datetime(year, month, day)
+        except ValueError:
+            meas_date = None
+    if meas_date is not None:
+        try:
+            hour, minute, second = (int(x) for x in header[176:184].decode('latin-1').split('.'))
+        except ValueError:
+            hour, minute, second = 0, 0, 0
+        raw.set_meas_date(meas_date.replace(hour=hour, minute=minute, second=second,
+                                            tzinfo=timezone.utc))
+
+    return raw
+
 
 class EDFConverter:
     """
@@ -18,29 +239,59 @@ class EDFConverter:
 
     Attributes:
         filepath (str): Path to the EDF file
-        raw (mne.io.Raw): MNE Raw object containing the loaded data
+        raw (mne.io.Raw): MNE Raw object (samples are loaded on demand)
+        _ch_names (List[str]): Cached channel names
+        _sfreq (float): Cached sampling rate in Hz
+        _meas_date: Cached measurement date (None if not set)
+        _name_to_idx (Dict[str, int]): Channel name to index lookup
+        _data_cache (Optional[np.ndarray]): Full data matrix, filled by the first get_data() call
     """
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, fast: bool = False):
         """
         Initialize the EDFConverter with an EDF file.
 
+        Only the header is read here. Samples are loaded into memory on the first
+        get_data() call (and so by to_json, to_numpy, to_arrow and to_blosc);
+        to_csv, to_hdf5 and to_numpy(compressed=False) stream blocks from disk
+        without loading the whole file.
+
+        With fast=True, plain EDF files are instead decoded up front by a Numba
+        kernel, which is much quicker than MNE's reader for files with short
+        data records. Unsupported variants (EDF+D, annotation signals, mixed
+        sampling rates) fall back to MNE.
+
         Args:
             filepath (str): Path to the EDF file to read
+            fast (bool): Whether to use the Numba decoder (requires numba)
 
         Raises:
             FileNotFoundError: If the EDF file doesn't exist
             ValueError: If the file cannot be read as EDF
+            ImportError: If fast=True and numba is not installed
         """
         self.filepath = Path(filepath)
         if not self.filepath.exists():
             raise FileNotFoundError(f"EDF file not found: {filepath}")
 
+        if fast:
+            _get_edf_decoder()
+
         try:
-            self.raw = mne.io.read_raw_edf(str(self.filepath), preload=True, verbose=False)
+            raw = _read_edf_fast(self.filepath) if fast else None
+            if raw is None:
+                raw = mne.io.read_raw_edf(str(self.filepath), preload=False, verbose=False)
+            self.raw = raw
         except Exception as e:
             raise ValueError(f"Failed to read EDF file: {e}")
 
+        # Cache header values; MNE rebuilds ch_names from info['chs'] on every access
+        self._ch_names = list(self.raw.ch_names)
+        self._sfreq = float(self.raw.info['sfreq'])
+        self._meas_date = self.raw.info['meas_date']
+        self._name_to_idx = {name: i for i, name in enumerate(self._ch_names)}
+        self._data_cache = None
+
     def get_info(self) -> Dict:
         """
         Get metadata and information about the EDF file.
@@ -50,15 +301,58 @@ class EDFConverter:
         """
         info = {
             'filename': self.filepath.name,
-            'n_channels': len(self.raw.ch_names),
-            'channel_names': self.raw.ch_names,
-            'sampling_rate': self.raw.info['sfreq'],
+            'n_channels': len(self._ch_names),
+            'channel_names': list(self._ch_names),
+            'sampling_rate': self._sfreq,
             'duration_seconds': self.raw.times[-1],
             'n_samples': len(self.raw.times),
-            'measurement_date': str(self.raw.info['meas_date']) if self.raw.info['meas_date'] else None,
+            'measurement_date': str(self._meas_date) if self._meas_date else None,
         }
         return info
 
+    def _get_picks(self, channels: Optional[List[str]] = None) -> Optional[np.ndarray]:
+        """
+        Resolve channel names to MNE picks.
+
+        Args:
+            channels (Optional[List[str]]): Channel names (None = all channels)
+
+        Returns:
+            Optional[np.ndarray]: Channel indices in the requested order, or None for all channels
+
+        Raises:
+            ValueError: If a channel name is not found
+        """
+        if not channels:
+            return None
+
+        missing = [c for c in channels if c not in self._name_to_idx]
+        if missing:
+            raise ValueError(f"Channels {missing} not found. Available channels: {self._ch_names}")
+
+        return np.fromiter((self._name_to_idx[c] for c in channels), dtype=np.intp,
+                           count=len(channels))
+
+    def _iter_blocks(self, picks: Optional[np.ndarray] = None,
+                     block_samples: int = 1 << 16):
+        """
+        Iterate over the recording in fixed-size sample blocks.
+
+        Args:
+            picks (Optional[np.ndarray]): Channel indices to read (None = all)
+            block_samples (int): Number of samples per block
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: (times, data) for each block, where data
+                                           is float32 of shape (n_channels, block_length)
+        """
+        n_times = self.raw.n_times
+        for start in range(0, n_times, block_samples):
+            stop = min(start + block_samples, n_times)
+            data, times = self.raw.get_data(picks=picks, start=start, stop=stop,
+                                            return_times=True)
+            yield times, data.astype(np.float32, copy=False)
+
     def get_data(self, channels: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get the raw signal data and time points.
@@ -69,12 +363,29 @@ class EDFConverter:
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: (data, times) where data is shape (n_channels, n_samples)
+
+        Note:
+            Data is float32 (in volts). EDF samples are at most 16-bit, so float32's
+            24-bit mantissa loses no recorded precision. Times stay float64.
+            When channels is None the returned array is the converter's cached
+            copy and is read-only; call .copy() before modifying it.
         """
-        if channels:
-            picks = mne.pick_channels(self.raw.ch_names, channels)
-            data = self.raw.get_data(picks=picks)
-        else:
-            data = self.raw.get_data()
+        # Decode the full matrix once and serve later calls (and channel subsets)
+        # from it, rather than re-reading and re-allocating for every export.
+        # Filling block by block avoids a transient full-size float64 copy.
+        if self._data_cache is None:
+            cache = np.empty((len(self._ch_names), self.raw.n_times), dtype=np.float32)
+            start = 0
+            for times, data in self._iter_blocks():
+                cache[:, start:start + times.size] = data
+                start += times.size
+            # Read-only so in-place edits by callers fail rather than leaking
+            # into every later export
+            cache.flags.writeable = False
+            self._data_cache = cache
+
+        picks = self._get_picks(channels)
+        data = self._data_cache if picks is None else self._data_cache[picks]
 
         times = self.raw.times
         return data, times
@@ -84,44 +395,83 @@ class EDFConverter:
         """
         Export EDF data to CSV format.
 
+        The recording is read and written in blocks, so the full data matrix is
+        never held in memory at once.
+
         Args:
             output_path (str): Path for the output CSV file
             channels (Optional[List[str]]): Specific channels to export (None = all)
             include_time (bool): Whether to include a time column
         """
-        data, times = self.get_data(channels)
+        picks = self._get_picks(channels)
 
         # Get channel names
         if channels:
             ch_names = channels
         else:
-            ch_names = self.raw.ch_names
-
-        with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-
-            # Write header
-            header = ['Time'] if include_time else []
-            header.extend(ch_names)
-            writer.writerow(header)
-
-            # Write data
-            for i in range(len(times)):
-                row = [times[i]] if include_time else []
-                row.extend(data[:, i])
-                writer.writerow(row)
+            ch_names = self._ch_names
+
+        header = ['Time'] if include_time else []
+        header.extend(ch_names)
+
+        # One format string per row, so each row is a single '%' call. Time uses
+        # repr ('%r' on the Python floats from tolist()) so late time stamps in
+        # long recordings keep sample resolution; channels use 8 significant digits
+        row_fmt = ','.join((['%r'] if include_time else []) + ['%.8g'] * len(ch_names))
+
+        # Binary mode: rows are pure ASCII numbers, so skip the text layer's
+        # encoding and newline translation
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write((','.join(header) + '\n').encode('utf-8'))
+
+            for times, data in self._iter_blocks(picks):
+                # Flip the (n_channels, block_length) block into a C-contiguous
+                # (block_length, n_columns) array so each output row is sequential
+                # in memory instead of strided across channels
+                if include_time:
+                    # float64 so late time stamps keep sample resolution
+                    arr = np.empty((times.size, data.shape[0] + 1), dtype=np.float64)
+                    arr[:, 0] = times
+                    arr[:, 1:] = data.T
+                else:
+                    arr = np.ascontiguousarray(data.T)
+
+                # tolist() converts the whole block to Python floats in C, avoiding
+                # the per-cell numpy scalar boxing that savetxt does via tuple(row)
+                lines = [row_fmt % tuple(row) for row in arr.tolist()]
+                lines.append('')
+                f.write('\n'.join(lines).encode('ascii'))
 
         print(f"CSV file saved to: {output_path}")
 
     def to_json(self, output_path: str, channels: Optional[List[str]] = None,
-                include_metadata: bool = True) -> None:
+                include_metadata: bool = True, pretty: bool = False,
+                include_time: bool = False) -> None:
         """
         Export EDF data to JSON format.
 
+        Output schema:
+            {
+              "metadata": {...},                      # if include_metadata
+              "data": {
+                "time": {"start": float, "sfreq": float, "n_samples": int},
+                "times": [...],                       # if include_time
+                "channels": {"<name>": [...], ...}
+              }
+            }
+
+        Sample k of each channel is at time start + k / sfreq.
+
+        Uses ``orjson`` when installed, which serializes the numpy arrays directly;
+        otherwise falls back to the standard library ``json`` module, encoding
+        channels in a process pool when pretty=True.
+
         Args:
             output_path (str): Path for the output JSON file
             channels (Optional[List[str]]): Specific channels to export (None = all)
             include_metadata (bool): Whether to include metadata in the output
+            pretty (bool): Whether to indent the output (slower, larger file)
+            include_time (bool): Whether to also write the explicit 'times' array
         """
         data, times = self.get_data(channels)
 
@@ -129,54 +479,312 @@ class EDFConverter:
         if channels:
             ch_names = channels
         else:
-            ch_names = self.raw.ch_names
+            ch_names = self._ch_names
+
+        # Samples are uniformly spaced, so the time axis is fully described by
+        # its start, rate and length
+        time_info = {
+            'start': float(times[0]) if times.size else 0.0,
+            'sfreq': self._sfreq,
+            'n_samples': int(times.size),
+        }
 
-        # Build JSON structure
-        output = {}
+        if pretty and orjson is None:
+            # The stdlib indenting encoder is pure Python and holds the GIL, so
+            # spread the channels over worker processes and splice the results
+            # into the same layout json.dump(indent=2) would produce. With one
+            # CPU or one channel the pool is pure overhead, so encode in-process.
+            members = [(ch_name, data[i], 3) for i, ch_name in enumerate(ch_names)]
+            if (os.cpu_count() or 1) > 1 and len(members) > 1:
+                with Pool() as pool:
+                    channel_parts = pool.map(_pretty_json_member, members)
+            else:
+                channel_parts = [_pretty_json_member(m) for m in members]
+
+            data_parts = [_pretty_json_member(('time', time_info, 2))]
+            if include_time:
+                data_parts.append(_pretty_json_member(('times', times, 2)))
+            if channel_parts:
+                data_parts.append('    "channels": {\n' + ',\n'.join(channel_parts) + '\n    }')
+            else:
+                data_parts.append('    "channels": {}')
+
+            parts = []
+            if include_metadata:
+                parts.append(_pretty_json_member(('metadata', self.get_info(), 1)))
+            parts.append('  "data": {\n' + ',\n'.join(data_parts) + '\n  }')
+
+            with open(output_path, 'w') as f:
+                f.write('{\n' + ',\n'.join(parts) + '\n}')
+        elif pretty:
+            # Build JSON structure
+            output = {}
+
+            if include_metadata:
+                output['metadata'] = self.get_info()
+
+            output['data'] = {'time': time_info}
+            if include_time:
+                output['data']['times'] = times
+            output['data']['channels'] = {ch_name: data[i] for i, ch_name in enumerate(ch_names)}
+
+            _write_json(output_path, output, pretty=True)
+        else:
+            # Encode and write one channel at a time, splicing the pieces into the
+            # same document, so only one channel's encoded bytes are held at once
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(b'{')
+                if include_metadata:
+                    f.write(b'"metadata":' + _json_dumps(self.get_info()) + b',')
+                f.write(b'"data":{"time":' + _json_dumps(time_info) + b',')
+                if include_time:
+                    f.write(b'"times":' + _json_dumps(times) + b',')
+                f.write(b'"channels":{')
+                for i, ch_name in enumerate(ch_names):
+                    if i:
+                        f.write(b',')
+                    f.write(_json_dumps(ch_name) + b':' + _json_dumps(data[i]))
+                f.write(b'}}}')
 
-        if include_metadata:
-            output['metadata'] = self.get_info()
+        print(f"JSON file saved to: {output_path}")
 
-        # Convert data to list format for JSON serialization
-        output['data'] = {
-            'times': times.tolist(),
-            'channels': {}
-        }
+    def to_numpy(self, output_path: str, channels: Optional[List[str]] = None,
+                 dtype: str = 'float32', compressed: bool = True) -> None:
+        """
+        Export EDF data to NumPy .npz format.
 
-        for i, ch_name in enumerate(ch_names):
-            output['data']['channels'][ch_name] = data[i, :].tolist()
+        With dtype='int16' each channel is quantized to 16 bits and stored with a
+        per-channel 'scale' and 'offset' (float = int16 * scale + offset). The
+        time axis is then stored as 'start_time' and 'n_samples' rather than as
+        an array. Use load_numpy() to read either layout back.
 
-        with open(output_path, 'w') as f:
-            json.dump(output, f, indent=2)
+        With compressed=False the data is written to an uncompressed .npy file
+        through a memory map, filled block by block straight from the EDF, so the
+        recording is never fully loaded. As with np.save, '.npy' is appended to
+        the path if missing. Channel names, sampling rate and time axis go to a
+        companion '<output>.npy.meta.json' file.
 
-        print(f"JSON file saved to: {output_path}")
+        Args:
+            output_path (str): Path for the output .npz (or .npy) file
+            channels (Optional[List[str]]): Specific channels to export (None = all)
+            dtype (str): 'float32' for raw samples or 'int16' for quantized samples
+            compressed (bool): Whether to write a compressed .npz archive
 
-    def to_numpy(self, output_path: str, channels: Optional[List[str]] = None) -> None:
+        Raises:
+            ValueError: If dtype is not supported, or 'int16' is used uncompressed
         """
-        Export EDF data to NumPy .npz format.
+        if dtype not in ('float32', 'int16'):
+            raise ValueError(f"Unsupported dtype '{dtype}'. Use 'float32' or 'int16'")
+        if dtype == 'int16' and not compressed:
+            raise ValueError("dtype='int16' requires compressed=True")
+
+        # Get channel names
+        if channels:
+            ch_names = channels
+        else:
+            ch_names = self._ch_names
+
+        if not compressed:
+            output_path = str(output_path)
+            if not output_path.endswith('.npy'):
+                output_path += '.npy'
+
+            picks = self._get_picks(channels)
+            # Python int: numpy 2 writes np.int64 shapes into the .npy header as a
+            # call expression, which np.load cannot parse back
+            n_samples = int(self.raw.n_times)
+            out = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float32,
+                                            shape=(len(ch_names), n_samples))
+            start = 0
+            for times, data in self._iter_blocks(picks):
+                out[:, start:start + times.size] = data
+                start += times.size
+            out.flush()
+            del out
+
+            metadata = {
+                'channel_names': list(ch_names),
+                'sampling_rate': self._sfreq,
+                'start_time': float(self.raw.times[0]) if n_samples else 0.0,
+                'n_samples': n_samples,
+            }
+            _write_json(output_path + '.meta.json', metadata)
+
+            print(f"NumPy file saved to: {output_path}")
+            return
+
+        data, times = self.get_data(channels)
+
+        if dtype == 'int16':
+            q, scale, offset = _quantize_int16(data)
+            np.savez_compressed(
+                output_path,
+                data=q,
+                scale=scale,
+                offset=offset,
+                start_time=times[0],
+                n_samples=times.size,
+                channel_names=ch_names,
+                sampling_rate=self._sfreq
+            )
+        else:
+            # Save as compressed numpy archive
+            np.savez_compressed(
+                output_path,
+                data=data,
+                times=times,
+                channel_names=ch_names,
+                sampling_rate=self._sfreq
+            )
+
+        print(f"NumPy file saved to: {output_path}")
+
+    def to_arrow(self, output_path: str, channels: Optional[List[str]] = None,
+                 compression: str = 'zstd') -> None:
+        """
+        Export EDF data to Arrow Feather format.
+
+        The table has a 'time' column followed by one column per channel.
+        Requires the optional ``pyarrow`` package.
 
         Args:
-            output_path (str): Path for the output .npz file
+            output_path (str): Path for the output .feather file
             channels (Optional[List[str]]): Specific channels to export (None = all)
+            compression (str): Feather compression codec ('zstd', 'lz4' or 'uncompressed')
         """
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+        except ImportError:
+            raise ImportError("Arrow export requires pyarrow: pip install pyarrow")
+
         data, times = self.get_data(channels)
 
         # Get channel names
         if channels:
             ch_names = channels
         else:
-            ch_names = self.raw.ch_names
+            ch_names = self._ch_names
 
-        # Save as compressed numpy archive
-        np.savez_compressed(
-            output_path,
-            data=data,
-            times=times,
-            channel_names=ch_names,
-            sampling_rate=self.raw.info['sfreq']
-        )
+        table = pa.table({'time': times, **{name: data[i] for i, name in enumerate(ch_names)}})
 
-        print(f"NumPy file saved to: {output_path}")
+        compression_level = 3 if compression == 'zstd' else None
+        feather.write_feather(table, output_path, compression=compression,
+                              compression_level=compression_level)
+
+        print(f"Arrow file saved to: {output_path}")
+
+    def to_blosc(self, output_path: str, channels: Optional[List[str]] = None) -> None:
+        """
+        Export EDF data to a Blosc2 compressed array file.
+
+        The data array is written with ZSTD and byte shuffle. Times, channel names
+        and sampling rate go to a companion '<output>.meta.json' file.
+        Requires the optional ``blosc2`` package.
+
+        Args:
+            output_path (str): Path for the output .bl2 file
+            channels (Optional[List[str]]): Specific channels to export (None = all)
+        """
+        try:
+            import blosc2
+        except ImportError:
+            raise ImportError("Blosc export requires blosc2: pip install blosc2")
+
+        data, times = self.get_data(channels)
+
+        # Get channel names
+        if channels:
+            ch_names = channels
+        else:
+            ch_names = self._ch_names
+
+        cparams = {
+            'codec': blosc2.Codec.ZSTD,
+            'clevel': 3,
+            'filters': [blosc2.Filter.SHUFFLE],
+            'nthreads': os.cpu_count() or 1,
+        }
+        blosc2.save_array(np.ascontiguousarray(data), str(output_path), mode='w', cparams=cparams)
+
+        metadata = {
+            'channel_names': list(ch_names),
+            'sampling_rate': self._sfreq,
+            'times': times,
+        }
+        _write_json(str(output_path) + '.meta.json', metadata)
+
+        print(f"Blosc file saved to: {output_path}")
+
+    def to_hdf5(self, output_path: str, channels: Optional[List[str]] = None,
+                chunk_seconds: float = 10.0, compression: Optional[str] = 'blosc:zstd') -> None:
+        """
+        Export EDF data to a chunked, compressed HDF5 file.
+
+        Data goes to the '/data' dataset of shape (n_channels, n_samples), chunked
+        into windows of chunk_seconds so time slices can be read without
+        decompressing the whole recording. Channel names, sampling rate, start
+        time and measurement date are stored as attributes of '/data'. The
+        recording is streamed in blocks, so it is never fully loaded into memory.
+        Requires the optional ``h5py`` package (and ``hdf5plugin`` for Blosc).
+
+        Args:
+            output_path (str): Path for the output .h5 file
+            channels (Optional[List[str]]): Specific channels to export (None = all)
+            chunk_seconds (float): Length of each chunk along the time axis
+            compression (Optional[str]): 'blosc:zstd', 'blosc:lz4', 'gzip', 'lzf' or None
+
+        Raises:
+            ValueError: If compression is not supported
+        """
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("HDF5 export requires h5py: pip install h5py")
+
+        if compression is not None and compression.startswith('blosc:'):
+            try:
+                import hdf5plugin
+            except ImportError:
+                raise ImportError("Blosc compression for HDF5 requires hdf5plugin: pip install hdf5plugin")
+            filter_kwargs = dict(hdf5plugin.Blosc(cname=compression.split(':', 1)[1], clevel=3,
+                                                  shuffle=hdf5plugin.Blosc.SHUFFLE))
+        elif compression in ('gzip', 'lzf'):
+            filter_kwargs = {'compression': compression, 'shuffle': True}
+        elif compression is None:
+            filter_kwargs = {}
+        else:
+            raise ValueError(f"Unsupported compression '{compression}'")
+
+        picks = self._get_picks(channels)
+
+        # Get channel names
+        if channels:
+            ch_names = channels
+        else:
+            ch_names = self._ch_names
+
+        n_samples = self.raw.n_times
+        chunk_len = max(1, min(int(chunk_seconds * self._sfreq), n_samples))
+        # Write whole chunks per block so no chunk is compressed twice
+        block_samples = chunk_len * max(1, (1 << 16) // chunk_len)
+
+        with h5py.File(output_path, 'w') as f:
+            dset = f.create_dataset('data', shape=(len(ch_names), n_samples), dtype=np.float32,
+                                    chunks=(len(ch_names), chunk_len), **filter_kwargs)
+
+            start = 0
+            for times, data in self._iter_blocks(picks, block_samples=block_samples):
+                dset[:, start:start + times.size] = data
+                start += times.size
+
+            dset.attrs['channel_names'] = list(ch_names)
+            dset.attrs['sampling_rate'] = self._sfreq
+            dset.attrs['start_time'] = float(self.raw.times[0]) if n_samples else 0.0
+            if self._meas_date:
+                dset.attrs['measurement_date'] = str(self._meas_date)
+
+        print(f"HDF5 file saved to: {output_path}")
 
     def plot(self, duration: float = 10.0, n_channels: int = 20,
              start: float = 0.0) -> None:
@@ -203,20 +811,88 @@ class EDFConverter:
         Raises:
             ValueError: If channel name is not found
         """
-        if channel_name not in self.raw.ch_names:
-            raise ValueError(f"Channel '{channel_name}' not found. Available channels: {self.raw.ch_names}")
+        if channel_name not in self._name_to_idx:
+            raise ValueError(f"Channel '{channel_name}' not found. Available channels: {self._ch_names}")
 
         data, times = self.get_data(channels=[channel_name])
         return data[0], times
 
 
+def _quantize_int16(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Quantize each channel to int16 over its own min/max range.
+
+    Args:
+        data (np.ndarray): Signal data of shape (n_channels, n_samples)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (q, scale, offset) where
+            data ~= q * scale + offset, and scale/offset have shape (n_channels, 1)
+    """
+    lo = data.min(axis=1, keepdims=True).astype(np.float64)
+    hi = data.max(axis=1, keepdims=True).astype(np.float64)
+    offset = (hi + lo) / 2.0
+    scale = (hi - lo) / 65535.0
+    # Flat channels would divide by zero; any non-zero scale reproduces them
+    scale[scale == 0] = 1.0
+
+    q = np.rint((data - offset) / scale)
+    np.clip(q, -32768, 32767, out=q)
+    return q.astype(np.int16), scale, offset
+
+
+def load_numpy(input_path: str) -> Dict:
+    """
+    Load an .npz or .npy file written by EDFConverter.to_numpy.
+
+    Quantized (int16) archives are dequantized to float32 and their time axis
+    is rebuilt from 'start_time', 'n_samples' and 'sampling_rate'. Uncompressed
+    .npy files are memory-mapped read-only, with metadata from '<file>.meta.json'.
+
+    Args:
+        input_path (str): Path to the .npz or .npy file
+
+    Returns:
+        Dict: Dictionary with 'data', 'times', 'channel_names' and 'sampling_rate'
+    """
+    if Path(input_path).suffix == '.npy':
+        with open(str(input_path) + '.meta.json', 'rb') as f:
+            metadata = json.load(f)
+        sfreq = float(metadata['sampling_rate'])
+        return {
+            'data': np.load(input_path, mmap_mode='r'),
+            'times': metadata['start_time'] + np.arange(metadata['n_samples']) / sfreq,
+            'channel_names': metadata['channel_names'],
+            'sampling_rate': sfreq,
+        }
+
+    with np.load(input_path) as npz:
+        sfreq = float(npz['sampling_rate'])
+        ch_names = npz['channel_names'].tolist()
+
+        if 'scale' in npz:
+            # scale/offset are float64, so cast the product back down
+            data = (npz['data'].astype(np.float32) * npz['scale'] + npz['offset']).astype(np.float32, copy=False)
+            times = float(npz['start_time']) + np.arange(int(npz['n_samples'])) / sfreq
+        else:
+            data = npz['data']
+            times = npz['times']
+
+    return {
+        'data': data,
+        'times': times,
+        'channel_names': ch_names,
+        'sampling_rate': sfreq,
+    }
+
+
 def main():
     """Example usage of the EDFConverter class."""
     import sys
 
     if len(sys.argv) < 2:
         print("Usage: python edf_converter.py <input_edf_file> [output_format]")
-        print("Formats: csv, json, numpy, info")
+        print("Formats: csv, json, numpy, npy, arrow, blosc, hdf5, info")
         print("Example: python edf_converter.py example.edf csv")
         sys.exit(1)
 
@@ -245,9 +921,25 @@ def main():
             output_file = Path(input_file).stem + '.npz'
             converter.to_numpy(output_file)
 
+        elif output_format == 'npy':
+            output_file = Path(input_file).stem + '.npy'
+            converter.to_numpy(output_file, compressed=False)
+
+        elif output_format == 'arrow' or output_format == 'feather':
+            output_file = Path(input_file).stem + '.feather'
+            converter.to_arrow(output_file)
+
+        elif output_format == 'blosc':
+            output_file = Path(input_file).stem + '.bl2'
+            converter.to_blosc(output_file)
+
+        elif output_format == 'hdf5' or output_format == 'h5':
+            output_file = Path(input_file).stem + '.h5'
+            converter.to_hdf5(output_file)
+
         else:
             print(f"Unknown format: {output_format}")
-            print("Available formats: csv, json, numpy, info")
+            print("Available formats: csv, json, numpy, npy, arrow, blosc, hdf5, info")
             sys.exit(1)
 
     except Exception as e: